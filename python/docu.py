@@ -8,7 +8,28 @@ Arguments:
 """
 __author__ = "first last"
 __version__ = "0.1"
-import sys, os, re
+import sys, os, re, io, pathlib
+
+_RE_MODULE_TITLE = re.compile('^"""([^\\s].+)')
+_RE_DATE = re.compile(".*20.+")
+_RE_CLASS_DOC = re.compile(' +""".+"""')
+_RE_FUNCDOC_OPEN = re.compile(' {7,9}"""')
+_RE_FUNCDOC_ONELINE = re.compile(' {7,9}"""(.+)"""')
+
+## one alternation classifying the remaining lines, the first matching group wins
+_DISPATCH_RE = re.compile(
+    '(?P<indentdoc> +""")'
+    '|(?P<arguments> +Arguments:)'
+    '|(?P<argitem> {9,12}[a-z]+)'
+    '|(?P<argplus>\\s{9,13}[a-zA-Z0-9]+\\s+-\\+.+)'
+    "|(?P<hashcomment>\\s*#' ?)")
+
+_SUB_CLASS_NAME = re.compile("^class +([^:\\s\\n]+).*\\n")
+_SUB_DOC_ONELINE = re.compile(' +"""(.+)"""')
+_SUB_DEF_NAME = re.compile("^ +def +([^:\\n]+).*\\n")
+_RE_ARG_ITEM_PARSE = re.compile("^\\s+(\\S+)\\s+-\\s+(.+)\\n?$")
+_RE_ARG_PLUS_PARSE = re.compile("^\\s+(\\S+)\\s+-\\+\\s*(.+)\\n?$")
+_RE_STRIP_INDENT = re.compile("^ {7,9}")
 
 def help(argv):
     print(__doc__.format(argv[1]))
@@ -16,74 +37,140 @@ def help(argv):
 def usage(argv):
     print(f"Usage: {argv[0]} args")
     
+## bits of State.flags
+MODULE, CLSS, FUNC, FUNCDOC = 1, 2, 4, 8
+
+class State:
+    """Parser state shared by the line handlers."""
+    def __init__(self):
+        self.flags = 0
+        self.yaml = 0
+        self.out = []
+
+def handle_funcdoc(state, line):
+    state.out.append(_RE_STRIP_INDENT.sub("",line))
+
+def handle_docquote(state, line):
+    if state.flags & FUNCDOC:
+        handle_funcdoc(state, line)
+
+def handle_class(state, line):
+    state.flags |= CLSS
+    state.out.append("\n**class %s**\n\n" % _SUB_CLASS_NAME.sub("\\1",line))
+
+def handle_def(state, line):
+    if state.flags & CLSS:
+        state.out.append("\n**def %s**\n" % _SUB_DEF_NAME.sub("\\1",line))
+        state.flags |= FUNC
+    elif state.flags & FUNCDOC:
+        handle_funcdoc(state, line)
+
+def handle_indentdoc(state, line):
+    if state.flags & CLSS and _RE_CLASS_DOC.match(line):
+        state.out.append("%s\n" % _SUB_DOC_ONELINE.sub("\\1",line))
+    elif state.flags & FUNC and _RE_FUNCDOC_OPEN.match(line):
+        state.flags = (state.flags | FUNCDOC) & ~FUNC
+        state.out.append("\n")
+    elif state.flags & FUNC and _RE_FUNCDOC_ONELINE.match(line):
+        state.out.append("\n%s\n\n" % _SUB_DOC_ONELINE.sub("\\1",line))
+        state.flags &= ~FUNC
+    elif state.flags & FUNCDOC:
+        state.flags &= ~(FUNCDOC | FUNC)
+
+def handle_arguments(state, line):
+    if state.flags & FUNCDOC:
+        state.out.append("> _Arguments:_\n\n>")
+
+def emit_argument_item(state, line, regex):
+    m = regex.match(line)
+    if m:
+        state.out.append(" - _%s_: %s\n" % (m.group(1), m.group(2)))
+    else:
+        handle_funcdoc(state, line)
+
+def handle_argitem(state, line):
+    if state.flags & FUNCDOC:
+        emit_argument_item(state, line, _RE_ARG_ITEM_PARSE)
+
+def handle_argplus(state, line):
+    if state.flags & FUNCDOC:
+        emit_argument_item(state, line, _RE_ARG_PLUS_PARSE)
+
+def handle_hashcomment(state, line):
+    if state.flags & FUNCDOC:
+        handle_funcdoc(state, line)
+    else:
+        ## text after the last #' marker without one following blank
+        text = line.rpartition("#'")[2]
+        state.out.append(text[1:] if text.startswith(" ") else text)
+
+def line_kind(line):
+    ## literal prefixes are checked before the regex
+    if line.startswith('"""'):
+        return 'docquote'
+    elif line.startswith(('class ', 'class\t')):
+        return 'class'
+    elif line.startswith(('    def', '     def')):
+        return 'def'
+    m = _DISPATCH_RE.match(line)
+    return m.lastgroup if m else None
+
+HANDLERS = {
+    'docquote': handle_docquote,
+    'class': handle_class,
+    'def': handle_def,
+    'indentdoc': handle_indentdoc,
+    'arguments': handle_arguments,
+    'argitem': handle_argitem,
+    'argplus': handle_argplus,
+    'hashcomment': handle_hashcomment
+}
+
 def main(argv):
-    if (len(argv)) == 1:
-        usage(argv)
-        
-    elif "-h" in argv or "--help" in argv:
-        help(argv)
-        exit()
     if len(argv) == 1:
         usage(argv)
-        exit()
+        return
+    if "-h" in argv or "--help" in argv:
+        help(argv)
+        return
     filename = argv[1]
     if not os.path.exists(filename):
         print("Error: File '%s' does not exists!")
         sys.exit(1)
     
-    file = open(filename,'r')
-    i = 0
-    module = False
-    yaml = 0
-    clss = False
-    func = False
-    funcdoc = False
-    for line in file:
-        i = i + 1
-        if (i < 6) and re.match('^"""([^\\s].+)',line):
-            yaml=1
-            print("---\ntitle: ",re.sub('""" *','',line),end="")
-            module = True
-        elif (i < 5 and yaml == 1):
-            yaml = yaml +1
-            print("author: %s" % line,end="")
-        elif (i < 5 and yaml == 2 and re.match(".*20.+",line)):
-            yaml = yaml + 1
-            print("date: %s---\n" % line,end="")
-        elif module and re.match('^"""',line):
-            module = False
-        elif module:                    
-            print(line,end="")
-        elif re.match("^class.+",line):
-            clss = True
-            print("\n**class %s**\n" % re.sub("^class +([^:\\s\\n]+).*\\n","\\1",line))
-        elif clss and re.match(' +""".+"""',line):
-            print("%s" % re.sub(' +"""(.+)"""',"\\1",line))
-        elif clss and re.match('^     ?def',line):
-            print("\n**def %s**" % re.sub("^ +def +([^:\\n]+).*\\n","\\1",line))
-            func = True
-        elif func and re.match(' {7,9}"""',line):
-            funcdoc = True
-            func = False
-            print("")
-        elif func and re.match(' {7,9}"""(.+)"""',line):
-            print("\n%s\n" % re.sub(' +"""(.+)"""',"\\1",line))
-            func = False
-        elif funcdoc:
-            if re.match(" +Arguments:",line):
-                print("> _Arguments:_\n\n>",end="")
-            elif re.match(" {9,12}[a-z]+",line):
-                print(" - _%s_: %s" % (re.sub("^\\s+([^\\s]+) +- .+\\n","\\1",line),  re.sub(".+ - (.+)\\n","\\1",line)))
-            elif re.match("\\s{9,13}[a-zA-Z0-9]+\\s+-\\+.+",line):
-                print(" - _%s_: %s" % (re.sub(".+ ([\\s]+) .+","\\1",line),  re.sub(".+ - (.+)","\\1",line)))
-            elif funcdoc and re.match(' +""".*',line):
-                funcdoc = False
-                func = False
-            elif funcdoc:
-                print(re.sub(" {7,9}","",line),end="")
-        elif re.match("\\s*#' ?",line):
-            print(re.sub(".*#' ?","",line),end="")
-    file.close()
+    ## iterating a StringIO splits on newlines only, like the file object
+    lines = io.StringIO(pathlib.Path(filename).read_text())
+    state = State()
+    for i, line in enumerate(lines, 1):
+        if (i < 6) and _RE_MODULE_TITLE.match(line):
+            state.yaml=1
+            state.out.append("---\ntitle:  %s" % line[3:].replace('"""',''))
+            state.flags |= MODULE
+        elif (i < 5 and state.yaml == 1):
+            state.yaml = state.yaml +1
+            state.out.append("author: %s" % line)
+        elif (i < 5 and state.yaml == 2 and _RE_DATE.match(line)):
+            state.yaml = state.yaml + 1
+            state.out.append("date: %s---\n" % line)
+        elif not line.strip():
+            ## blank lines can only be part of a docstring
+            if state.flags & MODULE:
+                state.out.append(line)
+            elif state.flags & FUNCDOC:
+                handle_funcdoc(state, line)
+        elif state.flags & MODULE:
+            ## inside the module docstring only its end is of interest
+            if line.startswith('"""'):
+                state.flags &= ~MODULE
+            else:
+                state.out.append(line)
+        else:
+            kind = line_kind(line)
+            if kind:
+                HANDLERS[kind](state, line)
+            elif state.flags & FUNCDOC:
+                handle_funcdoc(state, line)
+    sys.stdout.write("".join(state.out))
     
 if __name__ == "__main__":
     main(sys.argv)
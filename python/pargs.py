@@ -115,6 +115,42 @@ if __name__ == "__main__":
 
 import sys
 import re
+import math
+
+_RE_UNKNOWN_OPT = re.compile("--?\\w")
+## a line break followed by an empty or whitespace only line
+_RE_BLANK_LINE = re.compile("\n[^\\S\n]*(?:\n|\\Z)")
+
+def _number(conv, value):
+    ## like int()/float() but only ASCII, without a plus sign, blanks,
+    ## digit separators, nan or inf
+    if (not value.isascii() or value.startswith("+") or "_" in value
+            or value != value.strip()):
+        raise ValueError(value)
+    val = conv(value)
+    if not math.isfinite(val):
+        raise ValueError(value)
+    return(val)
+
+def _find(index, alive, name):
+    ## first argument with that name which was not consumed yet
+    for i in index.get(name, []):
+        if alive[i]:
+            return(i)
+    return(-1)
+
+def _next(alive, idx):
+    ## next argument after idx which was not consumed yet
+    if idx < 0:
+        return(-1)
+    for i in range(idx+1, len(alive)):
+        if alive[i]:
+            return(i)
+    return(-1)
+
+def _remaining(argv, alive):
+    return([arg for arg, keep in zip(argv, alive) if keep])
+
 class Pargs:
     """Pargs - Poor students argument parser."""    
     def __init__(self,doc,argv,version="0.0.0",color=True):
@@ -125,7 +161,12 @@ class Pargs:
             doc     - the help page
             argv    - the argument vector
             version - the application version [default: "0.0.0"]
-            color - should error message use color [default: True]
+            color - should error message use color if printed to a terminal [default: True]
+
+        The given argv list is copied and not modified in place. The argv
+        attribute of the parser is read-only and returns a new list of the
+        remaining arguments on each access: assigning to it raises an
+        AttributeError and changing the returned list has no effect.
         """
         if type(doc) != type(""):
             raise Exception("TypeError: Variable doc should be of type string! Wrong order of doc,argv?")
@@ -133,20 +174,25 @@ class Pargs:
             raise Exception("TypeError: Variable argv should be of type list! Wrong argument order of doc,argv?")
         self.doc = doc
         self.color = color
-        i = 0
-        l=len(argv)
-        while i < l-1:
+        new_argv = argv[:1]
+        for arg in argv[1:]:
             ## check for 'key=val' syntax
-            i=i+1
-            if re.search("=",argv[i]):
-                val=re.sub(".+=","",argv[i])
-                key=re.sub("=.+","",argv[i])
-                argv.insert(i+1,val)
-                argv[i]=key
-                l=l+1
-        self.argv = argv
+            if "=" in arg:
+                key, _, val = arg.partition("=")
+                new_argv.append(key)
+                new_argv.append(val)
+            else:
+                new_argv.append(arg)
+        self._argv = new_argv
+        ## consumed arguments are marked dead instead of being removed
+        self._alive = [True] * len(new_argv)
+        self._index = {}
+        for i, arg in enumerate(new_argv):
+            self._index.setdefault(arg, []).append(i)
         self._version=version
-        if color:
+        self._usage = None
+        ## error messages are printed to stdout, escapes only for a terminal
+        if color and sys.stdout.isatty():
             self.RED = "\033[31m"
             self.DEF = "\033[0m"
         else:
@@ -155,6 +201,14 @@ class Pargs:
         #' 
         #' ## Methods
         #'
+    @property
+    def argv(self):
+        """
+        Attribute, not a method: use `parser.argv`, not `parser.argv()`.
+        The list of arguments not yet consumed by the parse and subcommand
+        methods, starting with the script name.
+        """
+        return(_remaining(self._argv, self._alive))
     def check(self):
         """
         Check for any not supported option present in argv.
@@ -163,15 +217,13 @@ class Pargs:
         
         """
         
-        rhy = re.compile("--?\\w")
-        l = list(filter(rhy.match,self.argv))
-        if len(l)>0:
-            for i in l:
-                self.error("Error: Wrong argument: '%s'!" % i)
-                print(self.usage())
-            return(False)
-        else:
+        argv = _remaining(self._argv, self._alive)
+        if not any(_RE_UNKNOWN_OPT.match(a) for a in argv):
             return(True)
+        for i in [a for a in argv if _RE_UNKNOWN_OPT.match(a)]:
+            self.error(f"Error: Wrong argument: '{i}'!")
+            print(self.usage())
+        return(False)
             
     def error(self,msg):
         """
@@ -180,13 +232,13 @@ class Pargs:
         Arguments:
             msg - the message to display
         """
-        print("%s%s%s" % (self.RED,msg,self.DEF))
+        print(f"{self.RED}{msg}{self.DEF}")
 
     def help(self):
         """
         Display full help page.
         """
-        return(self.doc.format(self.argv[0]))
+        return(self.doc.format(self._argv[0]))
         
     def parse(self,type, ashort, along,default=None):
         """
@@ -194,64 +246,60 @@ class Pargs:
         
         Arguments:
             type    - data type of that option, either 'bool', 'int', 'float' or 'string'
-                      the boolean type is handeled as a flag and expects no value
+                      the boolean type is handeled as a flag and expects no value,
+                      int and float values must be finite ASCII numbers without
+                      a plus sign, they may be negative and floats may use exponents
             ashort  - short option name like '-v'
             along   - long option name like '--verbose'
             default - default value if the option is not given [default: None]
         """
-        idx = -1
-        if ashort in self.argv:
-            idx = self.argv.index(ashort)
-        elif along in self.argv:
-            idx = self.argv.index(along)
+        idx = _find(self._index, self._alive, ashort)
+        if idx == -1:
+            idx = _find(self._index, self._alive, along)
+        nxt = _next(self._alive, idx)
         if idx > -1 and type == "bool":
             res = True
-            if len(self.argv)>idx+1:
-                if re.match("^(FALSE|0)$",self.argv[idx+1],re.IGNORECASE):
-                    self.argv.pop(idx)
+            if nxt > -1:
+                if re.match("^(FALSE|0)$",self._argv[nxt],re.IGNORECASE):
+                    self._alive[nxt] = False
                     res = False
-                elif re.match("^(TRUE|1)$",self.argv[idx+1],re.IGNORECASE):
-                    self.argv.pop(idx)  
-            self.argv.pop(idx)
+                elif re.match("^(TRUE|1)$",self._argv[nxt],re.IGNORECASE):
+                    self._alive[nxt] = False
+            self._alive[idx] = False
             return res
         elif type == "bool":
             return False
         elif idx > -1 and type in ["int","float"]:
-            if len(self.argv)<=idx:
-                self.error("Error: missing argument for %s,%s!" % (ashort,along))
-                print(self.usage())
-                return(None)
-            elif len(self.argv)>idx+1:
+            if nxt > -1:
                 if type == "int":
-                    if re.match("[0-9]+$",self.argv[idx+1]):
-                        val=int(self.argv.pop(idx+1))
-                        self.argv.pop(idx)
-                        return(val)
-                    else:
-                         self.error("Error: wrong argument for %s,%s! Not an integer!" % (ashort,along))
-                         print(self.usage())
-                         return(None)
+                    try:
+                        val=_number(int,self._argv[nxt])
+                    except ValueError:
+                        self.error(f"Error: wrong argument for {ashort},{along}! Not an integer!")
+                        print(self.usage())
+                        return(None)
                 elif type == "float":
-                    if re.match("[\\.0-9]+$",self.argv[idx+1]):
-                        val=float(self.argv.pop(idx+1))
-                        self.argv.pop(idx)
-                        return(val)
-                    else:
-                         self.error("Error: wrong argument for %s,%s! Not a float!" % (ashort,along))
-                         print(self.usage())
-                         return(None)
+                    try:
+                        val=_number(float,self._argv[nxt])
+                    except ValueError:
+                        self.error(f"Error: wrong argument for {ashort},{along}! Not a float!")
+                        print(self.usage())
+                        return(None)
+                self._alive[nxt] = False
+                self._alive[idx] = False
+                return(val)
             else:
-                self.error("Error: Missing argument for argument %s,%s!"  % (ashort,along))
+                self.error(f"Error: Missing argument for argument {ashort},{along}!")
                 print(self.usage())
                 return(None)
                 
         elif idx > -1 and type == "string":
-            if len(self.argv)>idx+1:
-                val=self.argv.pop(idx+1)
-                self.argv.pop(idx)
-                return(val)
+            if nxt > -1:
+                self._alive[nxt] = False
+                self._alive[idx] = False
+                return(self._argv[nxt])
             else:
-                self.error("Error: missing argument for %s,%s!" % (ashort,along))
+                self.error(f"Error: missing argument for {ashort},{along}!")
                 print(self.usage())
                 return(None)
 
@@ -272,12 +320,9 @@ class Pargs:
                  to indicate a missing argument, or a single string for the
                  argument if only one positional argument is requested.
         """
-        res = []
-        for i in range(1,max+1):
-            if len(self.argv)>i:
-                res.append(self.argv[i])
-            else:
-                res.append(default)
+        res = _remaining(self._argv, self._alive)[1:max+1]
+        if len(res) < max:
+            res.extend([default] * (max - len(res)))
         if len(res)==1:
             return(res[0])
         else:
@@ -290,7 +335,7 @@ class Pargs:
         
         Returns: The Python script filename whch was used to start the Python application.
         """
-        return(self.argv[0])
+        return(self._argv[0])
         
     def subcommand(self, names):
         """
@@ -301,26 +346,26 @@ class Pargs:
         
         Returns: subcommand name if valid or empty string.
         """
-        if self.argv[1] in names:
-            return(self.argv.pop(1))
+        idx = _next(self._alive, 0)
+        if idx > -1 and self._argv[idx] in names:
+            self._alive[idx] = False
+            return(self._argv[idx])
         else:
-            self.error("Error: Wrong subcommand '%s'!" % (self.argv[1]))
-            self.error("Valid subcommands are '%s'!" % ("','".join(names)))
+            name = self._argv[idx] if idx > -1 else ""
+            valid = "','".join(names)
+            self.error(f"Error: Wrong subcommand '{name}'!")
+            self.error(f"Valid subcommands are '{valid}'!")
             print(self.usage())
             return(None)
     def usage(self):
         """
         Display docu text until the first empty line within that text.
         """
-        n = 0
-        res = ""
-        for line in self.doc.split("\n"):
-            n = n + 1
-            if n > 1 and re.match("\\s*$",line):
-                break
-            else:
-                res = res + line + "\n"
-        return(res.format(self.argv[0]))
+        if self._usage is None:
+            m = _RE_BLANK_LINE.search(self.doc)
+            res = self.doc + "\n" if m is None else self.doc[:m.start()+1]
+            self._usage = res.format(self._argv[0])
+        return(self._usage)
     def version(self):
         """
         Display application version.